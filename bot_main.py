@@ -1,18 +1,24 @@
 """Main entry point for Twitch Notification Bot."""
 import asyncio
+import bisect
 import logging
 from datetime import datetime
+from typing import Optional, Dict, Set
 
 from aiogram import Bot, Dispatcher
 from aiogram.client.default import DefaultBotProperties
 from aiogram.enums import ParseMode
+from aiogram.types import BufferedInputFile
 
 from config import config
 from database.models import Database
-from database.operations import StreamerOperations, MainMessageOperations
+from database.operations import StreamerOperations, MainMessageOperations, SessionOperations
 from services.twitch import TwitchService
+from services.circuit_breaker import CircuitBreaker, backoff_delay
+from services.live_board import LiveBoard
+from services.stream_state import StreamStateMachine, StreamState, StreamEvent
 from handlers import get_routers
-from utils.formatters import format_duration
+from utils.formatters import format_duration, format_stream_details
 
 # Configure logging
 logging.basicConfig(
@@ -33,7 +39,24 @@ class TwitchBot:
         self.db = Database(config.db_path)
         self.streamer_ops = StreamerOperations(self.db)
         self.main_msg_ops = MainMessageOperations(self.db)
-        self.twitch_service = TwitchService()
+        self.session_ops = SessionOperations(self.db)
+        self.twitch_service = TwitchService(CircuitBreaker(
+            error_threshold=config.circuit_error_threshold,
+            open_time=config.circuit_open_time,
+            max_open_time=config.circuit_max_open_time
+        ))
+        self.live_board = LiveBoard(
+            self.bot,
+            self.streamer_ops,
+            self.main_msg_ops,
+            config.chat_id,
+            config.board_edit_interval
+        ) if config.live_board else None
+        self._resume_from: Optional[str] = None
+        # Background initial checks of imported streamers
+        self.import_tasks: Set[asyncio.Task] = set()
+        self.state_machine = StreamStateMachine(config.offline_threshold)
+        self._rechecks: Dict[str, asyncio.Task] = {}
 
         # Register handlers
         for router in get_routers():
@@ -43,7 +66,10 @@ class TwitchBot:
         self.dp.workflow_data.update({
             "streamer_ops": self.streamer_ops,
             "main_msg_ops": self.main_msg_ops,
-            "twitch_service": self.twitch_service
+            "session_ops": self.session_ops,
+            "twitch_service": self.twitch_service,
+            "import_tasks": self.import_tasks,
+            "live_board": self.live_board
         })
     
     async def check_streamers_loop(self):
@@ -51,13 +77,20 @@ class TwitchBot:
         # Initial delay to let bot start
         await asyncio.sleep(10)
         
+        errors = 0
         while True:
             try:
                 await self.check_all_streamers()
+                errors = 0
                 await asyncio.sleep(config.check_interval)
             except Exception as e:
-                logger.error(f"Error in check loop: {e}", exc_info=True)
-                await asyncio.sleep(60)  # Wait 1 minute on error
+                errors += 1
+                delay = backoff_delay(errors, 60, 900)
+                logger.error(
+                    f"Error in check loop: {e}, retrying in {delay:.0f}s",
+                    exc_info=True
+                )
+                await asyncio.sleep(delay)
     
     async def check_all_streamers(self):
         """Check all tracked streamers."""
@@ -67,9 +100,35 @@ class TwitchBot:
             logger.info("No streamers to check")
             return
         
+        circuit = self.twitch_service.circuit
+        if circuit.is_open:
+            logger.warning(
+                f"Twitch unavailable ({circuit.last_error}), "
+                f"skipping check, retry in {circuit.retry_in:.0f}s"
+            )
+            return
+        
+        # Continue from where an interrupted sweep stopped
+        if self._resume_from:
+            start = bisect.bisect_left(streamers, self._resume_from)
+            streamers = streamers[start:] + streamers[:start]
+            self._resume_from = None
+        
         logger.info(f"Checking {len(streamers)} streamers...")
         
         for streamer_name in streamers:
+            if circuit.is_open:
+                logger.warning(
+                    f"Twitch unavailable, stopping check until next sweep "
+                    f"(resume from {streamer_name})"
+                )
+                self._resume_from = streamer_name
+                break
+            
+            if streamer_name in self._rechecks:
+                # Offline confirmation is in progress
+                continue
+            
             try:
                 await self.check_streamer(streamer_name)
                 await asyncio.sleep(2)  # Rate limiting
@@ -78,64 +137,171 @@ class TwitchBot:
     
     async def check_streamer(self, streamer_name: str):
         """Check individual streamer status."""
-        is_live = await self.twitch_service.check_stream_status(streamer_name)
+        stream = await self.twitch_service.get_stream_info(streamer_name)
         
-        if is_live is None:
+        if stream is None:
             logger.warning(f"Could not check status for {streamer_name}")
             return
         
         info = await self.streamer_ops.get_streamer(streamer_name)
         
-        if is_live:
-            # Streamer is live
-            await self.streamer_ops.update_streamer_status(
-                streamer_name,
-                is_live=True,
-                offline_checks=0
-            )
-            
+        if info is None:
+            # Removed while being checked
+            return
+        
+        state = StreamState(
+            is_live=bool(info['is_live']),
+            notified_live=bool(info['notified_live']),
+            offline_checks=info['offline_checks']
+        )
+        transition = self.state_machine.apply(state, stream.is_live)
+        
+        if transition.event == StreamEvent.WENT_LIVE:
             # Send notification if not already notified
-            if not info['notified_live']:
+            if not self.live_board:
                 await self.send_live_notification(streamer_name)
-                await self.streamer_ops.update_streamer_status(
+            if info['is_live'] and info['last_stream_start']:
+                # Stream was already live when tracking started
+                stream_start = info['last_stream_start']
+            else:
+                stream_start = await self.record_detection(
                     streamer_name,
-                    is_live=True,
-                    notified_live=True,
-                    last_stream_start=datetime.now().isoformat()
+                    stream.started_at,
+                    info
                 )
-                logger.info(f"{streamer_name} went live!")
-        else:
-            # Streamer is offline
-            if info['is_live']:
-                # Increment offline checks
-                offline_checks = info['offline_checks'] + 1
-                
-                if offline_checks >= 3:
-                    # Confirm offline status
-                    await self.send_offline_notification(streamer_name, info)
-                    await self.streamer_ops.update_streamer_status(
-                        streamer_name,
-                        is_live=False,
-                        notified_live=False,
-                        offline_checks=0,
-                        last_stream_end=datetime.now().isoformat()
-                    )
-                    logger.info(f"{streamer_name} went offline")
-                else:
-                    await self.streamer_ops.update_streamer_status(
-                        streamer_name,
-                        is_live=True,
-                        offline_checks=offline_checks
-                    )
-                    logger.info(f"{streamer_name} offline check {offline_checks}/3")
+            await self.streamer_ops.update_streamer_status(
+                streamer_name,
+                is_live=True,
+                notified_live=True,
+                offline_checks=0,
+                last_stream_start=stream_start
+            )
+            if self.live_board:
+                self.live_board.request_update()
+            logger.info(f"{streamer_name} went live!")
+        
+        elif transition.event == StreamEvent.WENT_OFFLINE:
+            # Confirm offline status
+            if not self.live_board:
+                await self.send_offline_notification(streamer_name, info)
+            await self.streamer_ops.update_streamer_status(
+                streamer_name,
+                is_live=False,
+                notified_live=False,
+                offline_checks=0,
+                last_stream_end=datetime.now().isoformat()
+            )
+            if self.live_board:
+                self.live_board.request_update()
+            logger.info(f"{streamer_name} went offline")
+        
+        elif transition.event == StreamEvent.OFFLINE_PENDING:
+            await self.streamer_ops.update_streamer_status(
+                streamer_name,
+                is_live=True,
+                offline_checks=transition.state.offline_checks
+            )
+            logger.info(
+                f"{streamer_name} offline check "
+                f"{transition.state.offline_checks}/{self.state_machine.offline_threshold}"
+            )
+            self.schedule_recheck(streamer_name)
+        
+        elif transition.state != state:
+            # Stream is back after offline blip
+            await self.streamer_ops.update_streamer_status(
+                streamer_name,
+                is_live=transition.state.is_live,
+                offline_checks=transition.state.offline_checks
+            )
+    
+    def schedule_recheck(self, streamer_name: str):
+        """Schedule quick recheck of streamer that looks offline."""
+        task = self._rechecks.get(streamer_name)
+        if task and not task.done() and task is not asyncio.current_task():
+            return
+        
+        self._rechecks[streamer_name] = asyncio.create_task(
+            self._recheck(streamer_name)
+        )
+    
+    async def _recheck(self, streamer_name: str):
+        """Recheck streamer outside the main sweep."""
+        try:
+            await asyncio.sleep(config.offline_recheck_delay)
+            await self.check_streamer(streamer_name)
+        except Exception as e:
+            logger.error(f"Error rechecking {streamer_name}: {e}", exc_info=True)
+        finally:
+            # A new recheck may have been scheduled by this one
+            if self._rechecks.get(streamer_name) is asyncio.current_task():
+                del self._rechecks[streamer_name]
+    
+    async def record_detection(
+        self,
+        streamer_name: str,
+        started_at: Optional[datetime],
+        info: dict
+    ) -> str:
+        """Record go-live detection lag and return stream start time."""
+        detected_at = datetime.now()
+        
+        if started_at is None:
+            logger.info(f"No upstream start time for {streamer_name}")
+            return detected_at.isoformat()
+        
+        # Store in local time like other timestamps
+        started_at = started_at.astimezone().replace(tzinfo=None)
+        
+        # Same broadcast back after a false offline is not a new session
+        for known in (info['last_stream_end'], info['last_stream_start']):
+            if known and started_at <= datetime.fromisoformat(known):
+                logger.info(f"{streamer_name} resumed known broadcast, lag not recorded")
+                return started_at.isoformat()
+        
+        lag_seconds = max(0.0, (detected_at - started_at).total_seconds())
+        
+        try:
+            await self.session_ops.add_session(
+                streamer_name,
+                started_at.isoformat(),
+                detected_at.isoformat(),
+                lag_seconds
+            )
+        except Exception as e:
+            logger.error(f"Error recording session for {streamer_name}: {e}", exc_info=True)
+        
+        return started_at.isoformat()
     
     async def send_live_notification(self, streamer_name: str):
         """Send notification when streamer goes live."""
         text = (
             f"🔴 <b>Стрим начался!</b>\n\n"
             f"👤 Стример: <b>{streamer_name}</b>\n"
-            f"🔗 <a href='https://www.twitch.tv/{streamer_name}'>Смотреть трансляцию</a>"
         )
+        
+        # Rendered from the snapshot of the latest check
+        stream = self.twitch_service.get_cached_info(streamer_name)
+        if stream:
+            details = format_stream_details(stream)
+            if details:
+                text += details + "\n"
+        
+        text += f"🔗 <a href='https://www.twitch.tv/{streamer_name}'>Смотреть трансляцию</a>"
+
+        thumbnail = await self.twitch_service.get_thumbnail(streamer_name)
+        if thumbnail:
+            try:
+                await self.bot.send_photo(
+                    config.chat_id,
+                    BufferedInputFile(thumbnail, filename=f"{streamer_name}.jpg"),
+                    caption=text
+                )
+                logger.info(f"Sent live notification for {streamer_name}")
+                return
+            except Exception as e:
+                # Fall back to text notification
+                logger.warning(f"Error sending live notification photo: {e}")
 
         try:
             await self.bot.send_message(
@@ -179,6 +345,10 @@ class TwitchBot:
             await self.db.connect()
             logger.info("Database initialized")
             
+            # Sync live board with current state
+            if self.live_board:
+                self.live_board.request_update()
+            
             # Start background tasks
             asyncio.create_task(self.check_streamers_loop())
             logger.info("Started stream checking loop")
@@ -189,6 +359,13 @@ class TwitchBot:
                 allowed_updates=self.dp.resolve_used_update_types()
             )
         finally:
+            tasks = list(self._rechecks.values()) + list(self.import_tasks)
+            for task in tasks:
+                task.cancel()
+            # Let rechecks and import checks finish before the database is closed
+            await asyncio.gather(*tasks, return_exceptions=True)
+            if self.live_board:
+                await self.live_board.close()
             await self.db.close()
             await self.bot.session.close()
             logger.info("Bot stopped")
@@ -15,6 +15,14 @@ class Config:
     chat_id: int
     check_interval: int = 120
     db_path: str = "twitch_bot.db"
+    import_concurrency: int = 10
+    live_board: bool = False
+    board_edit_interval: int = 30
+    circuit_error_threshold: float = 0.5
+    circuit_open_time: int = 30
+    circuit_max_open_time: int = 600
+    offline_threshold: int = 3
+    offline_recheck_delay: int = 20
     
     @classmethod
     def from_env(cls) -> "Config":
@@ -31,7 +39,15 @@ class Config:
             bot_token=bot_token,
             chat_id=int(chat_id),
             check_interval=int(os.getenv("CHECK_INTERVAL", "120")),
-            db_path=os.getenv("DB_PATH", "twitch_bot.db")
+            db_path=os.getenv("DB_PATH", "twitch_bot.db"),
+            import_concurrency=int(os.getenv("IMPORT_CONCURRENCY", "10")),
+            live_board=os.getenv("LIVE_BOARD", "false").lower() in ("1", "true", "yes"),
+            board_edit_interval=int(os.getenv("BOARD_EDIT_INTERVAL", "30")),
+            circuit_error_threshold=float(os.getenv("CIRCUIT_ERROR_THRESHOLD", "0.5")),
+            circuit_open_time=int(os.getenv("CIRCUIT_OPEN_TIME", "30")),
+            circuit_max_open_time=int(os.getenv("CIRCUIT_MAX_OPEN_TIME", "600")),
+            offline_threshold=int(os.getenv("OFFLINE_CHECKS", "3")),
+            offline_recheck_delay=int(os.getenv("OFFLINE_RECHECK_DELAY", "20"))
         )
 
 # Global config instance
@@ -50,5 +50,42 @@ class Database:
             )
         """)
         
+        await self.connection.execute("""
+            CREATE TABLE IF NOT EXISTS board_message (
+                chat_id INTEGER PRIMARY KEY,
+                message_id INTEGER NOT NULL,
+                content TEXT,
+                updated_at TEXT DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        
+        await self.connection.execute("""
+            CREATE TABLE IF NOT EXISTS stream_sessions (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                streamer_name TEXT NOT NULL,
+                started_at TEXT NOT NULL,
+                detected_at TEXT NOT NULL,
+                lag_seconds REAL NOT NULL
+            )
+        """)
+        
+        await self.connection.execute("""
+            CREATE INDEX IF NOT EXISTS idx_stream_sessions_streamer
+            ON stream_sessions (streamer_name, id)
+        """)
+        
+        # One session per broadcast: drop duplicates left by older versions
+        await self.connection.execute("""
+            DELETE FROM stream_sessions WHERE id NOT IN (
+                SELECT MIN(id) FROM stream_sessions
+                GROUP BY streamer_name, started_at
+            )
+        """)
+        
+        await self.connection.execute("""
+            CREATE UNIQUE INDEX IF NOT EXISTS idx_stream_sessions_broadcast
+            ON stream_sessions (streamer_name, started_at)
+        """)
+        
         await self.connection.commit()
         logger.info("Database tables created/verified")
\ No newline at end of file
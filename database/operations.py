@@ -1,6 +1,6 @@
 """Database operations for Twitch Bot."""
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterable, AsyncIterator
 import logging
 
 from database.models import Database
@@ -28,6 +28,36 @@ class StreamerOperations:
             logger.error(f"Error adding streamer {name}: {e}")
             return False
     
+    async def add_streamers(self, names: Iterable[str]) -> Optional[List[str]]:
+        """Add many streamers in a single transaction.
+
+        Returns names that were not tracked before, or None if the
+        transaction failed.
+        """
+        existing = set(await self.get_all_streamers())
+        new_names = []
+        for name in names:
+            name = name.lower()
+            if name not in existing:
+                existing.add(name)
+                new_names.append(name)
+
+        if not new_names:
+            return []
+
+        try:
+            await self.db.connection.executemany(
+                "INSERT OR IGNORE INTO streamers (name) VALUES (?)",
+                [(name,) for name in new_names]
+            )
+            await self.db.connection.commit()
+            logger.info(f"{len(new_names)} streamers added to tracking")
+            return new_names
+        except Exception as e:
+            await self.db.connection.rollback()
+            logger.error(f"Error adding streamers: {e}")
+            return None
+
     async def remove_streamer(self, name: str) -> bool:
         """Remove a streamer from tracking."""
         try:
@@ -36,6 +66,10 @@ class StreamerOperations:
                 "DELETE FROM streamers WHERE name = ?",
                 (name,)
             )
+            await self.db.connection.execute(
+                "DELETE FROM stream_sessions WHERE streamer_name = ?",
+                (name,)
+            )
             await self.db.connection.commit()
             
             if cursor.rowcount > 0:
@@ -53,6 +87,22 @@ class StreamerOperations:
         )
         rows = await cursor.fetchall()
         return [row["name"] for row in rows]
+
+    async def iter_streamers(self) -> AsyncIterator[str]:
+        """Iterate over tracked streamers without loading them all at once."""
+        async with self.db.connection.execute(
+            "SELECT name FROM streamers ORDER BY name"
+        ) as cursor:
+            async for row in cursor:
+                yield row["name"]
+
+    async def get_live_streamers(self) -> List[Dict[str, Any]]:
+        """Get streamers that are currently live."""
+        cursor = await self.db.connection.execute(
+            "SELECT name, last_stream_start FROM streamers WHERE is_live = 1 ORDER BY name"
+        )
+        rows = await cursor.fetchall()
+        return [dict(row) for row in rows]
     
     async def get_streamer(self, name: str) -> Optional[Dict[str, Any]]:
         """Get streamer information."""
@@ -102,6 +152,16 @@ class StreamerOperations:
         await self.db.connection.commit()
         logger.info(f"Updated status for {name}")
 
+    async def mark_live_if_not_notified(self, name: str, last_stream_start: str) -> bool:
+        """Mark streamer live unless its stream was already announced."""
+        cursor = await self.db.connection.execute(
+            "UPDATE streamers SET is_live = 1, last_stream_start = ? "
+            "WHERE name = ? AND notified_live = 0",
+            (last_stream_start, name.lower())
+        )
+        await self.db.connection.commit()
+        return cursor.rowcount > 0
+
 class MainMessageOperations:
     """Operations for main message management."""
     
@@ -131,3 +191,87 @@ class MainMessageOperations:
         if row:
             return dict(row)
         return None
+    
+    async def save_board_message(self, chat_id: int, message_id: int, content: str):
+        """Save or update live board message for chat."""
+        await self.db.connection.execute("""
+            INSERT INTO board_message (chat_id, message_id, content, updated_at)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT(chat_id) DO UPDATE SET
+                message_id = excluded.message_id,
+                content = excluded.content,
+                updated_at = excluded.updated_at
+        """, (chat_id, message_id, content, datetime.now().isoformat()))
+        await self.db.connection.commit()
+    
+    async def get_board_message(self, chat_id: int) -> Optional[Dict[str, Any]]:
+        """Get live board message information for chat."""
+        cursor = await self.db.connection.execute(
+            "SELECT message_id, content FROM board_message WHERE chat_id = ?",
+            (chat_id,)
+        )
+        row = await cursor.fetchone()
+        
+        if row:
+            return dict(row)
+        return None
+
+class SessionOperations:
+    """Operations for stream sessions and detection latency."""
+    
+    def __init__(self, db: Database):
+        self.db = db
+    
+    async def add_session(
+        self,
+        name: str,
+        started_at: str,
+        detected_at: str,
+        lag_seconds: float
+    ):
+        """Record detected stream session, once per broadcast."""
+        cursor = await self.db.connection.execute("""
+            INSERT OR IGNORE INTO stream_sessions (streamer_name, started_at, detected_at, lag_seconds)
+            VALUES (?, ?, ?, ?)
+        """, (name.lower(), started_at, detected_at, lag_seconds))
+        await self.db.connection.commit()
+        
+        if cursor.rowcount > 0:
+            logger.info(f"Session recorded for {name}, detection lag {lag_seconds:.0f}s")
+        else:
+            logger.info(f"Session for {name} started at {started_at} already recorded")
+    
+    async def get_detection_lags(self, name: str = None, limit: int = 500) -> List[float]:
+        """Get detection lags of the latest sessions, globally or for streamer."""
+        if name:
+            cursor = await self.db.connection.execute(
+                "SELECT lag_seconds FROM stream_sessions WHERE streamer_name = ? "
+                "ORDER BY id DESC LIMIT ?",
+                (name.lower(), limit)
+            )
+        else:
+            cursor = await self.db.connection.execute(
+                "SELECT lag_seconds FROM stream_sessions ORDER BY id DESC LIMIT ?",
+                (limit,)
+            )
+        rows = await cursor.fetchall()
+        return [row["lag_seconds"] for row in rows]
+    
+    async def get_detection_lags_by_streamer(self, limit: int = 100) -> Dict[str, List[float]]:
+        """Get detection lags of the latest sessions of every streamer."""
+        cursor = await self.db.connection.execute("""
+            SELECT streamer_name, lag_seconds FROM (
+                SELECT streamer_name, lag_seconds, ROW_NUMBER() OVER (
+                    PARTITION BY streamer_name ORDER BY id DESC
+                ) AS rn
+                FROM stream_sessions
+                WHERE streamer_name IN (SELECT name FROM streamers)
+            )
+            WHERE rn <= ?
+        """, (limit,))
+        rows = await cursor.fetchall()
+        
+        lags: Dict[str, List[float]] = {}
+        for row in rows:
+            lags.setdefault(row["streamer_name"], []).append(row["lag_seconds"])
+        return lags
@@ -1,11 +1,12 @@
 """Handlers package."""
 from aiogram import Router
-from handlers import start, menu, streamers
+from handlers import start, menu, streamers, admin
 
 def get_routers() -> list[Router]:
     """Get all routers."""
     return [
         start.router,
         menu.router,
-        streamers.router
+        streamers.router,
+        admin.router
     ]
@@ -0,0 +1,108 @@
+"""Admin command handlers."""
+from html import escape
+
+from aiogram import Router, F, types
+from aiogram.filters import Command, CommandObject
+
+from config import config
+from database.operations import SessionOperations
+from services.twitch import TwitchService
+from utils.formatters import format_seconds
+from utils.stats import latency_summary
+
+router = Router()
+# Admin commands are available only in the notification chat
+router.message.filter(F.chat.id == config.chat_id)
+
+CIRCUIT_STATE_NAMES = {
+    "closed": "🟢 Работает",
+    "open": "🔴 Приостановлен",
+    "half_open": "🟡 Проверка"
+}
+
+# Rolling windows for detection latency percentiles
+GLOBAL_LATENCY_WINDOW = 500
+STREAMER_LATENCY_WINDOW = 100
+
+def format_latency(summary: dict) -> str:
+    """Format latency percentiles."""
+    if not summary['count']:
+        return "нет данных"
+    return (
+        f"p50 {format_seconds(summary['p50'])}, "
+        f"p95 {format_seconds(summary['p95'])}, "
+        f"p99 {format_seconds(summary['p99'])} "
+        f"(стримов: {summary['count']})"
+    )
+
+@router.message(Command("health"))
+async def cmd_health(
+    message: types.Message,
+    twitch_service: TwitchService,
+    session_ops: SessionOperations
+):
+    """Show Twitch upstream health and detection latency."""
+    circuit = twitch_service.circuit.snapshot()
+    latency = latency_summary(
+        await session_ops.get_detection_lags(limit=GLOBAL_LATENCY_WINDOW)
+    )
+
+    text = (
+        f"🩺 <b>Состояние Twitch</b>\n\n"
+        f"Статус: {CIRCUIT_STATE_NAMES[circuit['state']]}\n"
+        f"Ошибки: {circuit['error_rate']:.0%} из {circuit['calls']} запросов\n"
+        f"Срабатываний подряд: {circuit['open_count']}"
+    )
+    if circuit['state'] != "closed":
+        text += (
+            f"\nПри срабатывании: {circuit['trip_error_rate']:.0%} ошибок "
+            f"из {circuit['trip_calls']} запросов"
+        )
+    if circuit['retry_in']:
+        text += f"\nПовтор через: {circuit['retry_in']:.0f} сек."
+    if circuit['last_error']:
+        text += f"\nПоследняя ошибка: <code>{circuit['last_error']}</code>"
+    text += f"\n\n⏱ Задержка обнаружения: {format_latency(latency)}"
+
+    await message.answer(text, parse_mode="HTML")
+
+@router.message(Command("latency"))
+async def cmd_latency(
+    message: types.Message,
+    command: CommandObject,
+    session_ops: SessionOperations
+):
+    """Show go-live detection latency, globally and per streamer."""
+    if command.args:
+        streamer_name = command.args.strip().lower()
+        latency = latency_summary(
+            await session_ops.get_detection_lags(streamer_name, STREAMER_LATENCY_WINDOW)
+        )
+        await message.answer(
+            f"⏱ <b>Задержка обнаружения: {escape(streamer_name)}</b>\n\n"
+            f"{format_latency(latency)}",
+            parse_mode="HTML"
+        )
+        return
+
+    latency = latency_summary(
+        await session_ops.get_detection_lags(limit=GLOBAL_LATENCY_WINDOW)
+    )
+    by_streamer = {
+        name: latency_summary(lags)
+        for name, lags in (
+            await session_ops.get_detection_lags_by_streamer(STREAMER_LATENCY_WINDOW)
+        ).items()
+    }
+    slowest = sorted(by_streamer.items(), key=lambda item: item[1]['p95'], reverse=True)
+
+    text = (
+        f"⏱ <b>Задержка обнаружения стримов</b>\n\n"
+        f"Все стримеры: {format_latency(latency)}"
+    )
+    if slowest:
+        text += "\n\n<b>Самые медленные (p95):</b>"
+        for name, summary in slowest[:10]:
+            text += f"\n• {name}: {format_latency(summary)}"
+
+    await message.answer(text, parse_mode="HTML")
@@ -1,10 +1,17 @@
 """Streamer management handlers."""
+import asyncio
+import io
+import logging
+from typing import Callable, Iterable, Iterator, List, Optional, Set
+
 from aiogram import Router, F, types
-from aiogram.types import InaccessibleMessage
+from aiogram.types import InaccessibleMessage, BufferedInputFile
 from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import State, StatesGroup
 from datetime import datetime
+from html import escape
 
+from config import config
 from database.operations import StreamerOperations, MainMessageOperations
 from keyboards.inline import (
     get_back_button,
@@ -12,15 +19,91 @@ from keyboards.inline import (
     get_streamer_info_keyboard,
     get_main_menu
 )
-from utils.formatters import format_datetime_russian, format_duration
+from utils.formatters import format_datetime_russian, format_duration, format_stream_details
+from utils.parsers import iter_streamer_names, iter_csv_streamer_names
 from services.twitch import TwitchService
+from services.live_board import LiveBoard
+
+logger = logging.getLogger(__name__)
 
 router = Router()
 
+# Maximum size of uploaded import file (bytes)
+MAX_IMPORT_FILE_SIZE = 1024 * 1024
+
 class AddStreamerStates(StatesGroup):
     """States for adding streamer."""
     waiting_for_name = State()
 
+class ImportStreamersStates(StatesGroup):
+    """States for bulk import of streamers."""
+    waiting_for_list = State()
+
+async def update_main_message(
+    message: types.Message,
+    main_msg_ops: MainMessageOperations,
+    text: str
+):
+    """Show result text in main message, recreating it if needed."""
+    main_msg = await main_msg_ops.get_main_message()
+    
+    if main_msg:
+        try:
+            await message.bot.edit_message_text(
+                text=text + "\n\nВыберите действие:",
+                chat_id=main_msg['chat_id'],
+                message_id=main_msg['message_id'],
+                reply_markup=get_main_menu(),
+                parse_mode="HTML"
+            )
+            return
+        except Exception:
+            # If edit fails, send new message
+            pass
+    
+    new_msg = await message.answer(
+        text + "\n\nВыберите действие:",
+        reply_markup=get_main_menu()
+    )
+    await main_msg_ops.save_main_message(new_msg.message_id, message.chat.id)
+
+async def check_initial_status(
+    streamer_name: str,
+    streamer_ops: StreamerOperations,
+    twitch_service: TwitchService
+):
+    """Check status of newly added streamer."""
+    stream = await twitch_service.get_stream_info(streamer_name)
+    
+    if stream and stream.is_live:
+        if stream.started_at:
+            started_at = stream.started_at.astimezone().replace(tzinfo=None)
+        else:
+            started_at = datetime.now()
+        # The sweep may have already announced this stream meanwhile
+        await streamer_ops.mark_live_if_not_notified(
+            streamer_name,
+            started_at.isoformat()
+        )
+
+async def check_initial_statuses(
+    names: List[str],
+    streamer_ops: StreamerOperations,
+    twitch_service: TwitchService
+):
+    """Check status of imported streamers concurrently."""
+    semaphore = asyncio.Semaphore(config.import_concurrency)
+    
+    async def check(name: str):
+        async with semaphore:
+            try:
+                await check_initial_status(name, streamer_ops, twitch_service)
+            except Exception as e:
+                logger.error(f"Error checking imported streamer {name}: {e}")
+    
+    await asyncio.gather(*(check(name) for name in names))
+    logger.info(f"Initial status checked for {len(names)} imported streamers")
+
 @router.callback_query(F.data == "add_streamer")
 async def add_streamer_start(callback: types.CallbackQuery, state: FSMContext):
     """Start adding streamer process."""
@@ -50,53 +133,18 @@ async def process_streamer_name(
     # Delete user's message
     await message.delete()
     
-    # Get main message info
-    main_msg = await main_msg_ops.get_main_message()
-    
     # Add streamer to database
     success = await streamer_ops.add_streamer(streamer_name)
     
     if success:
         # Check initial status
-        is_live = await twitch_service.check_stream_status(streamer_name)
-        
-        if is_live:
-            await streamer_ops.update_streamer_status(
-                streamer_name,
-                is_live=True,
-                last_stream_start=datetime.now().isoformat(),
-                notified_live=False
-            )
+        await check_initial_status(streamer_name, streamer_ops, twitch_service)
         
         text = f"✅ Стример <b>{streamer_name}</b> добавлен для отслеживания!"
     else:
         text = f"⚠️ Стример <b>{streamer_name}</b> уже отслеживается."
     
-    # Update main message
-    if main_msg:
-        try:
-            await message.bot.edit_message_text(
-                text=text + "\n\nВыберите действие:",
-                chat_id=main_msg['chat_id'],
-                message_id=main_msg['message_id'],
-                reply_markup=get_main_menu(),
-                parse_mode="HTML"
-            )
-        except Exception as e:
-            # If edit fails, send new message
-            new_msg = await message.answer(
-                text + "\n\nВыберите действие:",
-                reply_markup=get_main_menu()
-            )
-            await main_msg_ops.save_main_message(new_msg.message_id, message.chat.id)
-    else:
-        # Send new main message
-        new_msg = await message.answer(
-            text + "\n\nВыберите действие:",
-            reply_markup=get_main_menu()
-        )
-        await main_msg_ops.save_main_message(new_msg.message_id, message.chat.id)
-    
+    await update_main_message(message, main_msg_ops, text)
     await state.clear()
 
 @router.callback_query(F.data == "list_streamers")
@@ -133,7 +181,11 @@ async def list_streamers(callback: types.CallbackQuery, streamer_ops: StreamerOp
     await callback.answer()
 
 @router.callback_query(F.data.startswith("streamer:"))
-async def show_streamer_info(callback: types.CallbackQuery, streamer_ops: StreamerOperations):
+async def show_streamer_info(
+    callback: types.CallbackQuery,
+    streamer_ops: StreamerOperations,
+    twitch_service: TwitchService
+):
     """Show detailed streamer information."""
     # Check if message is accessible
     if isinstance(callback.message, InaccessibleMessage):
@@ -167,9 +219,18 @@ async def show_streamer_info(callback: types.CallbackQuery, streamer_ops: Stream
     else:
         duration_str = "Нет данных"
     
+    # Current stream details from the latest check, no extra request
+    details = ""
+    stream = twitch_service.get_cached_info(streamer_name)
+    if info['is_live'] and stream and stream.is_live:
+        details = format_stream_details(stream)
+        if details:
+            details += "\n"
+    
     text = (
         f"👤 <b>{streamer_name}</b>\n\n"
         f"{status_emoji} Статус: <b>{status_text}</b>\n"
+        f"{details}"
         f"📅 Последняя трансляция: {last_stream_date}\n"
         f"⏱ Длительность: {duration_str}\n\n"
         f"🔗 <a href='https://www.twitch.tv/{streamer_name}'>Открыть канал</a>"
@@ -184,7 +245,12 @@ async def show_streamer_info(callback: types.CallbackQuery, streamer_ops: Stream
     await callback.answer()
 
 @router.callback_query(F.data.startswith("delete:"))
-async def delete_streamer(callback: types.CallbackQuery, streamer_ops: StreamerOperations):
+async def delete_streamer(
+    callback: types.CallbackQuery,
+    streamer_ops: StreamerOperations,
+    twitch_service: TwitchService,
+    live_board: Optional[LiveBoard]
+):
     """Delete streamer from tracking."""
     # Check if message is accessible
     if isinstance(callback.message, InaccessibleMessage):
@@ -195,6 +261,9 @@ async def delete_streamer(callback: types.CallbackQuery, streamer_ops: StreamerO
     success = await streamer_ops.remove_streamer(streamer_name)
     
     if success:
+        twitch_service.forget(streamer_name)
+        if live_board:
+            live_board.request_update()
         text = f"✅ Стример <b>{streamer_name}</b> удален из отслеживания."
     else:
         text = f"❌ Ошибка при удалении стримера <b>{streamer_name}</b>."
@@ -204,4 +273,143 @@ async def delete_streamer(callback: types.CallbackQuery, streamer_ops: StreamerO
         reply_markup=get_main_menu(),
         parse_mode="HTML"
     )
-    await callback.answer()
\ No newline at end of file
+    await callback.answer()
+
+@router.callback_query(F.data == "import_streamers")
+async def import_streamers_start(callback: types.CallbackQuery, state: FSMContext):
+    """Start bulk import process."""
+    # Check if message is accessible
+    if isinstance(callback.message, InaccessibleMessage):
+        await callback.answer("❌ Сообщение недоступно. Используйте /start", show_alert=True)
+        return
+    
+    await callback.message.edit_text(
+        "📥 Отправьте файл (.txt или .csv) или сообщение со списком ников.\n\n"
+        "Ники разделяются переносом строки, запятой или пробелом.",
+        reply_markup=get_back_button()
+    )
+    await state.set_state(ImportStreamersStates.waiting_for_list)
+    await callback.answer()
+
+@router.message(ImportStreamersStates.waiting_for_list, F.document)
+async def process_import_document(
+    message: types.Message,
+    state: FSMContext,
+    streamer_ops: StreamerOperations,
+    main_msg_ops: MainMessageOperations,
+    twitch_service: TwitchService,
+    import_tasks: Set[asyncio.Task]
+):
+    """Process uploaded file with streamer names."""
+    document = message.document
+    await message.delete()
+    
+    if document.file_size and document.file_size > MAX_IMPORT_FILE_SIZE:
+        await update_main_message(
+            message,
+            main_msg_ops,
+            f"❌ Файл слишком большой (максимум {MAX_IMPORT_FILE_SIZE // 1024} КБ)."
+        )
+        await state.clear()
+        return
+    
+    buffer = await message.bot.download(document)
+    lines = io.TextIOWrapper(buffer, encoding="utf-8-sig", errors="replace", newline="")
+    if (document.file_name or "").lower().endswith(".csv"):
+        parse = iter_csv_streamer_names
+    else:
+        parse = iter_streamer_names
+    await import_streamers(
+        message, lines, parse, streamer_ops, main_msg_ops, twitch_service, import_tasks
+    )
+    await state.clear()
+
+@router.message(ImportStreamersStates.waiting_for_list, F.text)
+async def process_import_text(
+    message: types.Message,
+    state: FSMContext,
+    streamer_ops: StreamerOperations,
+    main_msg_ops: MainMessageOperations,
+    twitch_service: TwitchService,
+    import_tasks: Set[asyncio.Task]
+):
+    """Process message with streamer names."""
+    lines = message.text.splitlines()
+    await message.delete()
+    await import_streamers(
+        message, lines, iter_streamer_names,
+        streamer_ops, main_msg_ops, twitch_service, import_tasks
+    )
+    await state.clear()
+
+async def import_streamers(
+    message: types.Message,
+    lines: Iterable[str],
+    parse: Callable[[Iterable[str], List[str]], Iterator[str]],
+    streamer_ops: StreamerOperations,
+    main_msg_ops: MainMessageOperations,
+    twitch_service: TwitchService,
+    import_tasks: Set[asyncio.Task]
+):
+    """Validate, deduplicate and add streamers, then check them in background.
+
+    Check tasks are kept in ``import_tasks`` so the bot can cancel them
+    on shutdown.
+    """
+    invalid: List[str] = []
+    names = list(parse(lines, invalid))
+    added = await streamer_ops.add_streamers(names)
+    
+    if added is None:
+        await update_main_message(
+            message,
+            main_msg_ops,
+            "❌ Ошибка при импорте стримеров. Попробуйте еще раз."
+        )
+        return
+    
+    if added:
+        task = asyncio.create_task(
+            check_initial_statuses(added, streamer_ops, twitch_service)
+        )
+        import_tasks.add(task)
+        task.add_done_callback(import_tasks.discard)
+    
+    text = (
+        f"📥 <b>Импорт завершен</b>\n\n"
+        f"✅ Добавлено: {len(added)}\n"
+        f"⚠️ Уже отслеживались: {len(names) - len(added)}\n"
+        f"❌ Некорректные ники: {len(invalid)}"
+    )
+    if invalid:
+        preview = ", ".join(invalid[:10])
+        if len(invalid) > 10:
+            preview += ", ..."
+        text += f"\n<code>{escape(preview)}</code>"
+    
+    await update_main_message(message, main_msg_ops, text)
+
+@router.callback_query(F.data == "export_streamers")
+async def export_streamers(callback: types.CallbackQuery, streamer_ops: StreamerOperations):
+    """Send list of tracked streamers as a file."""
+    # Check if message is accessible
+    if isinstance(callback.message, InaccessibleMessage):
+        await callback.answer("❌ Сообщение недоступно. Используйте /start", show_alert=True)
+        return
+    
+    buffer = io.StringIO()
+    count = 0
+    async for name in streamer_ops.iter_streamers():
+        buffer.write(name)
+        buffer.write("\n")
+        count += 1
+    
+    if not count:
+        await callback.answer("📋 Список стримеров пуст.", show_alert=True)
+        return
+    
+    await callback.message.answer_document(
+        BufferedInputFile(buffer.getvalue().encode("utf-8"), filename="streamers.txt"),
+        caption=f"📤 Экспортировано стримеров: {count}"
+    )
+    await callback.answer()
@@ -8,7 +8,9 @@ def get_main_menu() -> InlineKeyboardMarkup:
     builder = InlineKeyboardBuilder()
     builder.button(text="➕ Добавить стримера", callback_data="add_streamer")
     builder.button(text="📋 Список стримеров", callback_data="list_streamers")
-    builder.adjust(1)
+    builder.button(text="📥 Импорт", callback_data="import_streamers")
+    builder.button(text="📤 Экспорт", callback_data="export_streamers")
+    builder.adjust(1, 1, 2)
     return builder.as_markup()
 
 def get_back_button() -> InlineKeyboardMarkup:
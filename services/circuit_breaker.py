@@ -0,0 +1,152 @@
+"""Circuit breaker for upstream requests."""
+import logging
+import random
+import time
+from collections import deque
+from enum import Enum
+from typing import Optional, Dict, Any
+
+logger = logging.getLogger(__name__)
+
+def backoff_delay(attempt: int, base: float, max_delay: float) -> float:
+    """Exponential backoff delay with jitter for given attempt (1-based).
+
+    Jitter only adds up to half of the delay on top, so the result is
+    never shorter than ``base``.
+    """
+    delay = min(max_delay, base * 2 ** max(attempt - 1, 0))
+    return min(max_delay, delay + random.uniform(0, delay / 2))
+
+class CircuitState(str, Enum):
+    """Circuit breaker states."""
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+class CircuitBreaker:
+    """Error-rate based circuit breaker with half-open probing."""
+
+    def __init__(
+        self,
+        error_threshold: float = 0.5,
+        window_size: int = 20,
+        min_calls: int = 5,
+        open_time: float = 30,
+        max_open_time: float = 600
+    ):
+        self.error_threshold = error_threshold
+        self.min_calls = min_calls
+        self.open_time = open_time
+        self.max_open_time = max_open_time
+        self.state = CircuitState.CLOSED
+        self.last_error: Optional[str] = None
+        self._results = deque(maxlen=window_size)
+        self._open_count = 0
+        self._retry_at = 0.0
+        self._probe_in_flight = False
+        self._trip_error_rate = 0.0
+        self._trip_calls = 0
+
+    @property
+    def error_rate(self) -> float:
+        """Share of failed calls in the rolling window."""
+        if not self._results:
+            return 0.0
+        return self._results.count(False) / len(self._results)
+
+    @property
+    def retry_in(self) -> float:
+        """Seconds until the next probe is allowed."""
+        if self.state != CircuitState.OPEN:
+            return 0.0
+        return max(0.0, self._retry_at - time.monotonic())
+
+    @property
+    def is_open(self) -> bool:
+        """Whether requests are currently rejected."""
+        return self.state == CircuitState.OPEN and self.retry_in > 0
+
+    def allow_request(self) -> bool:
+        """Check if a request may be sent upstream."""
+        if self.state == CircuitState.OPEN:
+            if self.retry_in > 0:
+                return False
+            self.state = CircuitState.HALF_OPEN
+            self._probe_in_flight = False
+            logger.info("Circuit half-open, probing upstream")
+
+        if self.state == CircuitState.HALF_OPEN:
+            # Only one probe at a time
+            if self._probe_in_flight:
+                return False
+            self._probe_in_flight = True
+
+        return True
+
+    def record_success(self):
+        """Record successful upstream call."""
+        if self.state == CircuitState.HALF_OPEN:
+            self.state = CircuitState.CLOSED
+            self._results.clear()
+            self._open_count = 0
+            self._probe_in_flight = False
+            logger.info("Circuit closed, upstream recovered")
+        self._results.append(True)
+
+    def record_failure(
+        self,
+        reason: str,
+        trip: bool = False,
+        retry_after: Optional[float] = None
+    ):
+        """Record failed upstream call.
+
+        ``trip`` opens the circuit immediately (e.g. on rate limiting),
+        ``retry_after`` sets the minimum time the circuit stays open.
+        """
+        self.last_error = reason
+
+        if self.state == CircuitState.HALF_OPEN:
+            self._open(retry_after)
+            return
+
+        self._results.append(False)
+        if trip or (
+            len(self._results) >= self.min_calls
+            and self.error_rate >= self.error_threshold
+        ):
+            self._open(retry_after)
+
+    def _open(self, retry_after: Optional[float] = None):
+        """Open circuit with jittered exponential backoff."""
+        self._open_count += 1
+        delay = backoff_delay(self._open_count, self.open_time, self.max_open_time)
+        if retry_after:
+            delay = max(delay, retry_after)
+
+        # Keep stats that caused the trip, a failed probe has none
+        if self._results:
+            self._trip_error_rate = self.error_rate
+            self._trip_calls = len(self._results)
+
+        self.state = CircuitState.OPEN
+        self._retry_at = time.monotonic() + delay
+        self._results.clear()
+        self._probe_in_flight = False
+        logger.warning(
+            f"Circuit opened for {delay:.0f}s ({self.last_error}), "
+            f"attempt {self._open_count}"
+        )
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Export current breaker state."""
+        return {
+            "state": self.state.value,
+            "error_rate": self.error_rate,
+            "calls": len(self._results),
+            "trip_error_rate": self._trip_error_rate,
+            "trip_calls": self._trip_calls,
+            "retry_in": self.retry_in,
+            "open_count": self._open_count,
+            "last_error": self.last_error
+        }
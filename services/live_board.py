@@ -0,0 +1,138 @@
+"""Live board: single pinned message with current live streamers."""
+import asyncio
+import logging
+import time
+from datetime import datetime
+from typing import Optional, List, Dict, Any
+
+from aiogram import Bot
+from aiogram.exceptions import TelegramBadRequest
+
+from database.operations import StreamerOperations, MainMessageOperations
+
+logger = logging.getLogger(__name__)
+
+# Telegram allows 4096 characters, keep room for the "more" line
+MAX_BOARD_LENGTH = 4000
+
+def render_live_board(streamers: List[Dict[str, Any]]) -> str:
+    """Render live board text, cut to fit into one message."""
+    if not streamers:
+        return "📺 <b>Сейчас в эфире</b>\n\nНикто не ведет трансляцию."
+
+    lines = [f"📺 <b>Сейчас в эфире</b> ({len(streamers)})\n"]
+    length = len(lines[0])
+    for index, streamer in enumerate(streamers):
+        name = streamer['name']
+        line = f"🔴 <a href='https://www.twitch.tv/{name}'>{name}</a>"
+        # Only start time is shown: elapsed time would change the
+        # rendered text (and force an edit) on every refresh
+        if streamer['last_stream_start']:
+            start_time = datetime.fromisoformat(streamer['last_stream_start'])
+            line += f" — с {start_time:%H:%M}"
+
+        if length + len(line) + 1 > MAX_BOARD_LENGTH:
+            lines.append(f"…и ещё {len(streamers) - index}")
+            break
+        lines.append(line)
+        length += len(line) + 1
+
+    return "\n".join(lines)
+
+class LiveBoard:
+    """Pinned message edited in place instead of per-event notifications."""
+
+    def __init__(
+        self,
+        bot: Bot,
+        streamer_ops: StreamerOperations,
+        main_msg_ops: MainMessageOperations,
+        chat_id: int,
+        min_interval: int = 30
+    ):
+        self.bot = bot
+        self.streamer_ops = streamer_ops
+        self.main_msg_ops = main_msg_ops
+        self.chat_id = chat_id
+        self.min_interval = min_interval
+        self._last_edit = 0.0
+        self._dirty = False
+        self._task: Optional[asyncio.Task] = None
+
+    def request_update(self):
+        """Schedule debounced board refresh."""
+        self._dirty = True
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self):
+        """Cancel pending refresh and wait for it to stop."""
+        if self._task and not self._task.done():
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+
+    async def _run(self):
+        """Refresh board until no more updates are requested."""
+        while self._dirty:
+            delay = self._last_edit + self.min_interval - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            # Requests arriving during refresh trigger one more pass
+            self._dirty = False
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.error(f"Error refreshing live board: {e}", exc_info=True)
+            self._last_edit = time.monotonic()
+
+    async def refresh(self):
+        """Render board and edit message if content changed."""
+        streamers = await self.streamer_ops.get_live_streamers()
+        text = render_live_board(streamers)
+        board = await self.main_msg_ops.get_board_message(self.chat_id)
+
+        if board and board['content'] == text:
+            return
+
+        if board:
+            try:
+                await self.bot.edit_message_text(
+                    text=text,
+                    chat_id=self.chat_id,
+                    message_id=board['message_id'],
+                    disable_web_page_preview=True
+                )
+                await self.main_msg_ops.save_board_message(
+                    self.chat_id, board['message_id'], text
+                )
+                logger.info("Live board updated")
+                return
+            except TelegramBadRequest as e:
+                if "message is not modified" in str(e):
+                    await self.main_msg_ops.save_board_message(
+                        self.chat_id, board['message_id'], text
+                    )
+                    return
+                if "message is too long" in str(e):
+                    # Recreating would fail the same way
+                    logger.error(f"Live board text is too long: {e}")
+                    return
+                logger.warning(f"Live board message unavailable, recreating: {e}")
+
+        msg = await self.bot.send_message(
+            self.chat_id,
+            text,
+            disable_web_page_preview=True
+        )
+        try:
+            await self.bot.pin_chat_message(
+                self.chat_id,
+                msg.message_id,
+                disable_notification=True
+            )
+        except Exception as e:
+            logger.warning(f"Could not pin live board message: {e}")
+
+        await self.main_msg_ops.save_board_message(self.chat_id, msg.message_id, text)
+        logger.info("Live board created")
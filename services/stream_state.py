@@ -0,0 +1,67 @@
+"""Live/offline state machine for tracked streamers."""
+from dataclasses import dataclass
+from enum import Enum
+
+class StreamEvent(str, Enum):
+    """Outcome of applying a check result."""
+    NONE = "none"
+    WENT_LIVE = "went_live"
+    OFFLINE_PENDING = "offline_pending"
+    WENT_OFFLINE = "went_offline"
+
+@dataclass(frozen=True)
+class StreamState:
+    """Stored state of streamer."""
+    is_live: bool
+    notified_live: bool
+    offline_checks: int = 0
+
+@dataclass(frozen=True)
+class Transition:
+    """New state and event produced by a check result."""
+    event: StreamEvent
+    state: StreamState
+
+class StreamStateMachine:
+    """Live/offline transitions with offline confirmation hysteresis.
+
+    A live stream is reported offline only after ``offline_threshold``
+    consecutive offline results, so short blips do not end it.
+    """
+
+    def __init__(self, offline_threshold: int = 3):
+        if offline_threshold < 1:
+            raise ValueError("offline_threshold must be at least 1")
+        self.offline_threshold = offline_threshold
+
+    def apply(self, state: StreamState, observed_live: bool) -> Transition:
+        """Apply check result to current state."""
+        if observed_live:
+            if not state.notified_live:
+                return Transition(
+                    StreamEvent.WENT_LIVE,
+                    StreamState(is_live=True, notified_live=True)
+                )
+            return Transition(
+                StreamEvent.NONE,
+                StreamState(is_live=True, notified_live=True)
+            )
+
+        if not state.is_live:
+            return Transition(StreamEvent.NONE, state)
+
+        offline_checks = state.offline_checks + 1
+        if offline_checks >= self.offline_threshold:
+            return Transition(
+                StreamEvent.WENT_OFFLINE,
+                StreamState(is_live=False, notified_live=False)
+            )
+
+        return Transition(
+            StreamEvent.OFFLINE_PENDING,
+            StreamState(
+                is_live=True,
+                notified_live=state.notified_live,
+                offline_checks=offline_checks
+            )
+        )
@@ -0,0 +1,85 @@
+"""Size-bounded LRU cache for stream thumbnails."""
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Optional, Dict, Tuple
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+class ThumbnailCache:
+    """LRU cache of thumbnail images with deduplicated fetches."""
+
+    def __init__(
+        self,
+        max_items: int = 100,
+        max_bytes: int = 16 * 1024 * 1024,
+        max_image_size: int = 1024 * 1024,
+        ttl: float = 300
+    ):
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self.max_image_size = max_image_size
+        self.ttl = ttl
+        self.total_bytes = 0
+        self._items: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+        self._pending: Dict[str, asyncio.Task] = {}
+
+    async def get(self, url: str) -> Optional[bytes]:
+        """Get thumbnail from cache or fetch it once for all waiters."""
+        cached = self._items.get(url)
+        if cached and time.monotonic() - cached[0] < self.ttl:
+            self._items.move_to_end(url)
+            return cached[1]
+
+        task = self._pending.get(url)
+        if task is None:
+            task = asyncio.create_task(self._fetch(url))
+            self._pending[url] = task
+            task.add_done_callback(lambda _: self._pending.pop(url, None))
+
+        return await asyncio.shield(task)
+
+    async def _fetch(self, url: str) -> Optional[bytes]:
+        """Download thumbnail and store it in cache."""
+        try:
+            async with aiohttp.ClientSession() as session:
+                async with session.get(url, timeout=10) as response:
+                    if response.status != 200:
+                        logger.warning(f"Error fetching thumbnail {url}: {response.status}")
+                        return None
+
+                    if (response.content_length or 0) > self.max_image_size:
+                        logger.warning(f"Thumbnail {url} is too large")
+                        return None
+
+                    data = bytearray()
+                    async for chunk in response.content.iter_chunked(64 * 1024):
+                        data.extend(chunk)
+                        if len(data) > self.max_image_size:
+                            logger.warning(f"Thumbnail {url} is too large")
+                            return None
+                    data = bytes(data)
+        except Exception as e:
+            logger.error(f"Error fetching thumbnail {url}: {e}")
+            return None
+
+        self._put(url, data)
+        return data
+
+    def _put(self, url: str, data: bytes):
+        """Store image, evicting least recently used entries."""
+        old = self._items.pop(url, None)
+        if old:
+            self.total_bytes -= len(old[1])
+
+        self._items[url] = (time.monotonic(), data)
+        self.total_bytes += len(data)
+
+        while self._items and (
+            len(self._items) > self.max_items or self.total_bytes > self.max_bytes
+        ):
+            _, (_, evicted) = self._items.popitem(last=False)
+            self.total_bytes -= len(evicted)
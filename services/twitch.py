@@ -1,30 +1,181 @@
 """Twitch service for checking stream status."""
+import asyncio
 import aiohttp
+import json
 import re
 import logging
-from typing import Optional
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional, Dict, Any
+
+from services.circuit_breaker import CircuitBreaker
+from services.thumbnails import ThumbnailCache
 
 logger = logging.getLogger(__name__)
 
+LD_JSON_RE = re.compile(
+    r'<script[^>]*type="application/ld\+json"[^>]*>(.*?)</script>',
+    re.DOTALL
+)
+THUMBNAIL_SIZE = "640x360"
+
+@dataclass
+class StreamInfo:
+    """Snapshot of stream state parsed from channel page."""
+    is_live: bool
+    started_at: Optional[datetime] = None
+    title: Optional[str] = None
+    category: Optional[str] = None
+    viewer_count: Optional[int] = None
+    thumbnail_url: Optional[str] = None
+
+def parse_datetime(value: Any) -> Optional[datetime]:
+    """Parse ISO timestamp into timezone-aware datetime."""
+    if not isinstance(value, str):
+        return None
+    
+    try:
+        parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    
+    if parsed.tzinfo is None:
+        return None
+    return parsed
+
+def find_broadcast(html: str) -> Optional[Dict[str, Any]]:
+    """Find structured data object describing live broadcast."""
+    for block in LD_JSON_RE.findall(html):
+        try:
+            data = json.loads(block)
+        except ValueError:
+            continue
+        
+        for item in data if isinstance(data, list) else [data]:
+            if isinstance(item, dict) and isinstance(item.get("publication"), dict):
+                return item
+    return None
+
+def pick_thumbnail(value: Any) -> Optional[str]:
+    """Pick medium-sized thumbnail URL."""
+    urls = value if isinstance(value, list) else [value]
+    urls = [url for url in urls if isinstance(url, str)]
+    if not urls:
+        return None
+    
+    for url in urls:
+        if THUMBNAIL_SIZE in url:
+            return url
+    return urls[0].replace("{width}x{height}", THUMBNAIL_SIZE)
+
+def parse_viewer_count(value: Any) -> Optional[int]:
+    """Get viewer count from interaction statistic."""
+    for stat in value if isinstance(value, list) else [value]:
+        if isinstance(stat, dict) and "userInteractionCount" in stat:
+            try:
+                return int(stat["userInteractionCount"])
+            except (TypeError, ValueError):
+                return None
+    return None
+
+def parse_stream_info(html: str) -> StreamInfo:
+    """Parse stream snapshot from channel page."""
+    if not re.search(r'"isLiveBroadcast":\s*true', html):
+        return StreamInfo(is_live=False)
+    
+    broadcast = find_broadcast(html)
+    if broadcast is None:
+        match = re.search(r'"startDate":\s*"([^"]+)"', html)
+        return StreamInfo(
+            is_live=True,
+            started_at=parse_datetime(match.group(1)) if match else None
+        )
+    
+    category = broadcast.get("genre")
+    if isinstance(category, list):
+        category = category[0] if category else None
+    
+    return StreamInfo(
+        is_live=True,
+        started_at=parse_datetime(broadcast["publication"].get("startDate")),
+        title=broadcast.get("description") or None,
+        category=category if isinstance(category, str) else None,
+        viewer_count=parse_viewer_count(broadcast.get("interactionStatistic")),
+        thumbnail_url=pick_thumbnail(broadcast.get("thumbnailUrl"))
+    )
+
 class TwitchService:
     """Service for interacting with Twitch."""
-    
-    def __init__(self):
+
+    def __init__(self, circuit: Optional[CircuitBreaker] = None):
         self.headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
-    
-    async def check_stream_status(self, streamer_name: str) -> Optional[bool]:
-        """Check if streamer is live."""
+        self.circuit = circuit or CircuitBreaker()
+        self.thumbnails = ThumbnailCache()
+        self._snapshots: Dict[str, StreamInfo] = {}
+
+    async def get_stream_info(self, streamer_name: str) -> Optional[StreamInfo]:
+        """Check stream status and cache the parsed snapshot."""
+        if not self.circuit.allow_request():
+            logger.debug(f"Circuit open, skipping check for {streamer_name}")
+            return None
+
         try:
             async with aiohttp.ClientSession() as session:
                 url = f'https://www.twitch.tv/{streamer_name}'
                 async with session.get(url, headers=self.headers, timeout=10) as response:
                     if response.status == 200:
                         html = await response.text()
-                        match = re.search(r'"isLiveBroadcast":\s*true', html)
-                        return match is not None
+                        self.circuit.record_success()
+                        info = parse_stream_info(html)
+                        self._snapshots[streamer_name.lower()] = info
+                        return info
+
+                    logger.error(f"Error fetching {streamer_name}: {response.status}")
+                    if response.status == 429:
+                        # Rate limited: stop sending requests right away
+                        self.circuit.record_failure(
+                            "HTTP 429",
+                            trip=True,
+                            retry_after=self._parse_retry_after(response)
+                        )
+                    elif response.status >= 500:
+                        self.circuit.record_failure(f"HTTP {response.status}")
                     else:
-                        logger.error(f"Error fetching {streamer_name}: {response.status}")
-                        return None
+                        # Other client errors are not upstream failures
+                        self.circuit.record_success()
+                    return None
+        except asyncio.TimeoutError:
+            logger.error(f"Timeout checking {streamer_name}")
+            self.circuit.record_failure("timeout")
+            return None
+        except aiohttp.ClientError as e:
+            logger.error(f"Error checking {streamer_name}: {e}")
+            self.circuit.record_failure(f"connection error: {e.__class__.__name__}")
+            return None
         except Exception as e:
             logger.error(f"Error checking {streamer_name}: {e}")
+            self.circuit.record_failure(f"error: {e.__class__.__name__}")
+            return None
+
+    def get_cached_info(self, streamer_name: str) -> Optional[StreamInfo]:
+        """Get snapshot from the latest check without requesting Twitch."""
+        return self._snapshots.get(streamer_name.lower())
+
+    def forget(self, streamer_name: str):
+        """Drop cached snapshot of streamer."""
+        self._snapshots.pop(streamer_name.lower(), None)
+
+    async def get_thumbnail(self, streamer_name: str) -> Optional[bytes]:
+        """Get thumbnail image of current stream."""
+        info = self.get_cached_info(streamer_name)
+        if not info or not info.is_live or not info.thumbnail_url:
+            return None
+        return await self.thumbnails.get(info.thumbnail_url)
+
+    @staticmethod
+    def _parse_retry_after(response: aiohttp.ClientResponse) -> Optional[float]:
+        """Get Retry-After header value in seconds."""
+        try:
+            return float(response.headers.get('Retry-After', ''))
+        except ValueError:
             return None
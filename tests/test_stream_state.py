@@ -0,0 +1,71 @@
+"""Tests for stream state machine."""
+import pytest
+
+from services.stream_state import StreamStateMachine, StreamState, StreamEvent
+
+OFFLINE = StreamState(is_live=False, notified_live=False)
+LIVE = StreamState(is_live=True, notified_live=True)
+
+def test_went_live():
+    transition = StreamStateMachine().apply(OFFLINE, observed_live=True)
+    
+    assert transition.event == StreamEvent.WENT_LIVE
+    assert transition.state == LIVE
+
+def test_live_before_notification_goes_live():
+    # Marked live by initial check, but not announced yet
+    state = StreamState(is_live=True, notified_live=False)
+    transition = StreamStateMachine().apply(state, observed_live=True)
+    
+    assert transition.event == StreamEvent.WENT_LIVE
+
+def test_stays_live():
+    transition = StreamStateMachine().apply(LIVE, observed_live=True)
+    
+    assert transition.event == StreamEvent.NONE
+    assert transition.state == LIVE
+
+def test_stays_offline():
+    transition = StreamStateMachine().apply(OFFLINE, observed_live=False)
+    
+    assert transition.event == StreamEvent.NONE
+    assert transition.state == OFFLINE
+
+def test_blip_recovery():
+    machine = StreamStateMachine(offline_threshold=3)
+    
+    pending = machine.apply(LIVE, observed_live=False)
+    assert pending.event == StreamEvent.OFFLINE_PENDING
+    assert pending.state.is_live
+    assert pending.state.offline_checks == 1
+    
+    recovered = machine.apply(pending.state, observed_live=True)
+    assert recovered.event == StreamEvent.NONE
+    assert recovered.state == LIVE
+
+def test_reaching_threshold_goes_offline():
+    machine = StreamStateMachine(offline_threshold=3)
+    state = LIVE
+    events = []
+    
+    for _ in range(3):
+        transition = machine.apply(state, observed_live=False)
+        events.append(transition.event)
+        state = transition.state
+    
+    assert events == [
+        StreamEvent.OFFLINE_PENDING,
+        StreamEvent.OFFLINE_PENDING,
+        StreamEvent.WENT_OFFLINE
+    ]
+    assert state == OFFLINE
+
+def test_threshold_of_one_goes_offline_immediately():
+    transition = StreamStateMachine(offline_threshold=1).apply(LIVE, observed_live=False)
+    
+    assert transition.event == StreamEvent.WENT_OFFLINE
+    assert transition.state == OFFLINE
+
+def test_invalid_threshold():
+    with pytest.raises(ValueError):
+        StreamStateMachine(offline_threshold=0)
@@ -1,7 +1,12 @@
 """Formatting utilities."""
 from datetime import datetime, timedelta
+from html import escape
 import locale
 import logging
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from services.twitch import StreamInfo
 
 logger = logging.getLogger(__name__)
 
@@ -32,3 +37,24 @@ def format_duration(duration: timedelta) -> str:
     minutes, _ = divmod(remainder, 60)
     
     return f'{hours} часов {minutes} минут'
+
+def format_seconds(seconds: float) -> str:
+    """Format short interval in Russian."""
+    minutes, seconds = divmod(int(round(seconds)), 60)
+    
+    if minutes:
+        return f'{minutes} мин {seconds} сек'
+    return f'{seconds} сек'
+
+def format_stream_details(info: "StreamInfo") -> str:
+    """Format title, category and viewers of live stream snapshot."""
+    lines = []
+    
+    if info.title:
+        lines.append(f'📝 {escape(info.title)}')
+    if info.category:
+        lines.append(f'🎮 Категория: {escape(info.category)}')
+    if info.viewer_count is not None:
+        lines.append(f'👁 Зрителей: {info.viewer_count:,}'.replace(',', ' '))
+    
+    return '\n'.join(lines)
@@ -0,0 +1,87 @@
+"""Parsing utilities for streamer lists."""
+import csv
+import itertools
+import re
+from typing import Iterable, Iterator, Set, List
+
+# Twitch logins: 3-25 characters, latin letters, digits and underscore
+STREAMER_NAME_RE = re.compile(r'^[a-z0-9_]{3,25}$')
+SEPARATORS_RE = re.compile(r'[,;\s]+')
+CHANNEL_URL_RE = re.compile(r'^(?:https?://)?(?:www\.|m\.)?twitch\.tv/', re.IGNORECASE)
+
+# First column names treated as CSV header
+CSV_HEADER_NAMES = {
+    'login', 'user_login', 'username', 'user_name', 'name',
+    'nick', 'nickname', 'channel', 'streamer'
+}
+
+def normalize_streamer_name(raw: str) -> str:
+    """Normalize streamer name (strip @, channel URL, quotes, case)."""
+    name = raw.strip().strip('"\'')
+    name = CHANNEL_URL_RE.sub('', name)
+    return name.lstrip('@').rstrip('/').lower()
+
+def is_valid_streamer_name(name: str) -> bool:
+    """Check if name is a valid Twitch login."""
+    return STREAMER_NAME_RE.match(name) is not None
+
+def _unique_names(tokens: Iterable[str], invalid: List[str]) -> Iterator[str]:
+    """Yield unique valid names, appending rejected tokens to ``invalid``."""
+    seen: Set[str] = set()
+
+    for token in tokens:
+        name = normalize_streamer_name(token)
+        if not name or name in seen:
+            continue
+
+        # Rejected names are remembered too, so each is reported once
+        seen.add(name)
+        if not is_valid_streamer_name(name):
+            invalid.append(token)
+            continue
+
+        yield name
+
+def iter_streamer_names(lines: Iterable[str], invalid: List[str]) -> Iterator[str]:
+    """Yield unique valid streamer names from a plain list.
+
+    Names are separated by newlines, commas, semicolons or whitespace.
+    Lines are consumed lazily, so large uploads are never fully loaded
+    into memory. Rejected tokens are appended to ``invalid``.
+    """
+    tokens = (
+        token
+        for line in lines
+        for token in SEPARATORS_RE.split(line)
+        if token
+    )
+    return _unique_names(tokens, invalid)
+
+def iter_csv_streamer_names(lines: Iterable[str], invalid: List[str]) -> Iterator[str]:
+    """Yield unique valid streamer names from the first column of a CSV.
+
+    A header row is skipped if its first cell is a known column name or
+    not a valid login. Rejected cells are appended to ``invalid``.
+    """
+    def first_cells() -> Iterator[str]:
+        rows = iter(lines)
+        first = next(rows, None)
+        if first is None:
+            return
+
+        # Spreadsheets in some locales export with semicolons
+        delimiter = ';' if first.count(';') > first.count(',') else ','
+        reader = csv.reader(itertools.chain([first], rows), delimiter=delimiter)
+
+        for index, row in enumerate(reader):
+            if not row or not row[0].strip():
+                continue
+
+            if index == 0:
+                name = normalize_streamer_name(row[0])
+                if name in CSV_HEADER_NAMES or not is_valid_streamer_name(name):
+                    continue
+
+            yield row[0]
+
+    return _unique_names(first_cells(), invalid)
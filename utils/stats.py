@@ -0,0 +1,22 @@
+"""Statistics utilities."""
+from typing import Sequence, Dict, Optional
+
+def percentile(values: Sequence[float], p: float) -> Optional[float]:
+    """Get p-th percentile (0-100) using linear interpolation."""
+    if not values:
+        return None
+    
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * p / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+def latency_summary(values: Sequence[float]) -> Dict[str, Optional[float]]:
+    """Get p50/p95/p99 summary of latency samples."""
+    return {
+        "count": len(values),
+        "p50": percentile(values, 50),
+        "p95": percentile(values, 95),
+        "p99": percentile(values, 99)
+    }